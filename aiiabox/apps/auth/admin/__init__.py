@@ -0,0 +1,3 @@
+from .token import TokenAdmin
+
+__all__ = ["TokenAdmin"]
@@ -0,0 +1,29 @@
+"""
+Index authtoken_token.created to back the admin date_hierarchy.
+
+The token admin drills down by creation date; without an index that
+drill-down scans the whole token table on every changelist load.
+"""
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("authtoken", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "authtoken_token_created_idx ON authtoken_token (created);"
+            ),
+            reverse_sql=(
+                "DROP INDEX CONCURRENTLY IF EXISTS authtoken_token_created_idx;"
+            ),
+        ),
+    ]
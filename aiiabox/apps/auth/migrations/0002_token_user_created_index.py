@@ -0,0 +1,32 @@
+"""
+Composite index on authtoken_token(user_id, created DESC).
+
+Token lookups filter by user, and token-history queries order by
+creation time within a user; the composite index serves both with a
+single index seek regardless of table size.
+"""
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("apps_auth", "0001_token_created_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "authtoken_token_user_created_idx "
+                "ON authtoken_token (user_id, created DESC);"
+            ),
+            reverse_sql=(
+                "DROP INDEX CONCURRENTLY IF EXISTS "
+                "authtoken_token_user_created_idx;"
+            ),
+        ),
+    ]
@@ -1,3 +1,3 @@
-from .auth import create_auth_token
+from .auth import bulk_create_tokens, create_auth_token
 
-__all__ = ["create_auth_token"]
+__all__ = ["bulk_create_tokens", "create_auth_token"]
@@ -30,3 +30,20 @@ def create_auth_token(sender, instance, created, **kwargs):
     """
     if created:
         Token.objects.create(user=instance)
+
+
+def bulk_create_tokens(users):
+    """
+    Create tokens for many users with a single multi-row INSERT.
+
+    post_save signals do not fire on User.objects.bulk_create, so batch
+    user-provisioning flows must call this once afterwards instead of
+    paying one INSERT plus one signal dispatch per user.
+
+    Assumes: users are saved User instances without existing tokens
+    Behavior: rows that would conflict with existing tokens are skipped
+    """
+    Token.objects.bulk_create(
+        [Token(user=user, key=Token.generate_key()) for user in users],
+        ignore_conflicts=True,
+    )
@@ -5,12 +5,15 @@ Only tests custom code - does NOT test Django or DRF framework behavior.
 
 Covers:
 - Token auto-creation signal
+- Bulk token creation helper
 """
 
 from django.contrib.auth.models import User
 from django.test import TestCase
 from rest_framework.authtoken.models import Token
 
+from apps.auth.signals import bulk_create_tokens
+
 
 class TokenSignalTestCase(TestCase):
     """Test that tokens are auto-created when users are created."""
@@ -60,3 +63,33 @@ class TokenSignalTestCase(TestCase):
         # Token should not change
         updated_token = Token.objects.get(user=user)
         self.assertEqual(original_token.key, updated_token.key)
+
+
+class BulkCreateTokensTestCase(TestCase):
+    """Test the bulk token creation helper for batch user flows."""
+
+    def test_creates_tokens_for_bulk_created_users(self):
+        """Helper should create a token for each signal-less bulk user."""
+        users = User.objects.bulk_create(
+            [
+                User(username="bulk1", email="bulk1@example.com"),
+                User(username="bulk2", email="bulk2@example.com"),
+            ]
+        )
+
+        bulk_create_tokens(users)
+
+        self.assertEqual(Token.objects.filter(user__in=users).count(), 2)
+
+    def test_existing_tokens_are_preserved(self):
+        """Helper should not replace tokens users already have."""
+        user = User.objects.create_user(
+            username="existing",
+            email="existing@example.com",
+            password="pass123",
+        )
+        original_key = Token.objects.get(user=user).key
+
+        bulk_create_tokens([user])
+
+        self.assertEqual(Token.objects.get(user=user).key, original_key)
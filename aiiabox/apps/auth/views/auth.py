@@ -28,6 +28,20 @@ class TokenView(generics.RetrieveAPIView):
     serializer_class = TokenSerializer
 
     def get_object(self):  # pragma: no cover
-        """Get or create token for authenticated user."""
-        token, _created = Token.objects.get_or_create(user=self.request.user)
-        return token
+        """
+        Get or create token for authenticated user.
+
+        The post_save signal guarantees every user already has a token,
+        so the hot path is a plain indexed get without the transaction
+        and savepoint overhead of get_or_create. Creation is only a
+        fallback for tokens deleted out of band.
+        """
+        try:
+            # user_id= skips re-loading the User object; .only() limits
+            # the row to the two columns the serializer exposes
+            return Token.objects.only("key", "created").get(
+                user_id=self.request.user.pk
+            )
+        except Token.DoesNotExist:
+            token, _created = Token.objects.get_or_create(user=self.request.user)
+            return token
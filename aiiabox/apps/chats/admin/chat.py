@@ -1,15 +1,9 @@
 from django.contrib import admin
+from django.db.models import Count
+from django.urls import reverse
+from django.utils.html import format_html
 
-from apps.chats.models import Chat, Message
-
-
-class MessageInline(admin.TabularInline):
-    """Inline display of messages within chat admin."""
-
-    model = Message
-    fields = ["user", "role", "content", "tokens", "created_at"]
-    readonly_fields = ["created_at"]
-    extra = 0
+from apps.chats.models import Chat
 
 
 @admin.register(Chat)
@@ -24,9 +18,9 @@ class ChatAdmin(admin.ModelAdmin):
         "updated_at",
     ]
     list_filter = ["created_at", "updated_at", "user"]
+    list_select_related = ["user"]
     search_fields = ["title", "user__username"]
     readonly_fields = ["created_at", "updated_at"]
-    inlines = [MessageInline]
 
     fieldsets = (
         (
@@ -50,6 +44,18 @@ class ChatAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):  # pragma: no cover
+        """
+        Join the user row and precompute message counts for the changelist.
+
+        Replaces one COUNT(*) query per rendered row with a single
+        grouped aggregate.
+        """
+        queryset = super().get_queryset(request)
+        return queryset.select_related("user").annotate(
+            _message_count=Count("messages")
+        )
+
     def user_display(self, obj):  # pragma: no cover
         """
         Display user's full name or username.
@@ -65,7 +71,19 @@ class ChatAdmin(admin.ModelAdmin):
     user_display.short_description = "User"
 
     def message_count(self, obj):  # pragma: no cover
-        """Display the total number of messages in this chat."""
-        return obj.messages.count()
+        """
+        Display the message count as a link to the filtered Message changelist.
+
+        Long conversations made the old MessageInline stream every message
+        (including full content text) into the change form on open; the
+        linked changelist loads messages lazily and paginated instead.
+        """
+        changelist_url = reverse("admin:chats_message_changelist")
+        return format_html(
+            '<a href="{}?chat__id__exact={}">{}</a>',
+            changelist_url,
+            obj.pk,
+            obj._message_count,
+        )
 
     message_count.short_description = "Messages"
@@ -5,15 +5,18 @@ Provides REST API endpoints for chat CRUD operations with TokenAuthentication
 and proper permission checks to ensure user isolation.
 """
 
+from .authentication import CachedTokenAuthentication
 from .chat_serializer import ChatSerializer
 from .chat_viewset import ChatViewSet
-from .message_serializer import MessageSerializer
+from .message_serializer import MessageListSerializer, MessageSerializer
 from .message_viewset import MessageViewSet
 from .permissions import IsOwnerOrReadOnly
 
 __all__ = [
+    "CachedTokenAuthentication",
     "IsOwnerOrReadOnly",
     "ChatSerializer",
+    "MessageListSerializer",
     "MessageSerializer",
     "ChatViewSet",
     "MessageViewSet",
@@ -0,0 +1,51 @@
+"""
+Token authentication with a short-lived in-process cache.
+
+Every API request under DRF's TokenAuthentication costs one SELECT on
+authtoken_token. Hot clients re-present the same token on every call,
+so a small TTL cache turns that round-trip into a dict lookup.
+"""
+
+import time
+
+from django.conf import settings
+from rest_framework.authentication import TokenAuthentication
+
+# Default seconds a successful token lookup stays cached. Override with
+# settings.TOKEN_CACHE_TTL; set to 0 to disable caching entirely (the
+# test settings do, so query-count pins stay deterministic).
+DEFAULT_TOKEN_CACHE_TTL = 30
+
+# Safety valve: drop the whole cache rather than grow unbounded
+MAX_CACHED_TOKENS = 10000
+
+# token key -> (monotonic expiry, (user, token))
+_token_cache = {}
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that memoizes successful lookups for a short TTL.
+
+    Only successful credentials are cached - invalid or deleted tokens
+    always fall through to the database. The TTL bounds how long a
+    revoked token keeps authenticating from a warm cache, so keep it
+    short (seconds, not minutes).
+    """
+
+    def authenticate_credentials(self, key):
+        ttl = getattr(settings, "TOKEN_CACHE_TTL", DEFAULT_TOKEN_CACHE_TTL)
+        if ttl <= 0:
+            return super().authenticate_credentials(key)
+
+        now = time.monotonic()
+        entry = _token_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        result = super().authenticate_credentials(key)
+
+        if len(_token_cache) >= MAX_CACHED_TOKENS:  # pragma: no cover
+            _token_cache.clear()
+        _token_cache[key] = (now + ttl, result)
+        return result
@@ -20,7 +20,7 @@ class ChatSerializer(serializers.ModelSerializer):
     - title (optional): Chat title, defaults to "Chat" if not provided, max 200 chars
     - created_at (read-only): Timestamp when chat was created
     - updated_at (read-only): Timestamp when chat was last updated
-    - message_count (read-only): Computed count of messages in chat
+    - message_count (read-only): Denormalized count of messages in chat
 
     Validation:
     - title is optional; if provided, cannot be empty/whitespace only
@@ -29,21 +29,11 @@ class ChatSerializer(serializers.ModelSerializer):
     Assumes: User is authenticated (enforced by view permission classes)
     """
 
-    message_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Chat
         fields = ["id", "user", "title", "created_at", "updated_at", "message_count"]
         read_only_fields = ["id", "user", "created_at", "updated_at", "message_count"]
 
-    def get_message_count(self, obj):
-        """
-        Return count of messages in this chat.
-
-        Used for displaying conversation size without loading all messages.
-        """
-        return obj.messages.count()
-
     def validate_title(self, value):
         """
         Validate chat title.
@@ -6,25 +6,28 @@ Implements proper filtering, authentication, and permission checks.
 """
 
 from rest_framework import viewsets
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 
 from ..models import Chat
+from .authentication import CachedTokenAuthentication
 from .chat_serializer import ChatSerializer
 from .permissions import IsOwnerOrReadOnly
 
 
-class StandardResultsSetPagination(PageNumberPagination):
+class ChatsCursorPagination(CursorPagination):
     """
-    Standard pagination for list endpoints.
+    Cursor pagination for the chat list, newest activity first.
 
-    Returns 20 items per page, allows customization via ?page_size=N
+    Cursor pages are index range scans on Chat(user, -updated_at), so
+    page N costs the same as page 1 - unlike LIMIT/OFFSET, which scans
+    and skips all preceding rows.
     """
 
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+    ordering = "-updated_at"
 
 
 class ChatViewSet(viewsets.ModelViewSet):
@@ -40,16 +43,19 @@ class ChatViewSet(viewsets.ModelViewSet):
 
     Authentication: TokenAuthentication (requires 'Authorization: Token <token>')
     Permission: IsAuthenticated + IsOwnerOrReadOnly (users see only their chats)
-    Pagination: 20 items per page on list endpoint
+    Pagination: cursor-based, 20 items per page on list endpoint
 
     Assumes: User is authenticated (enforced by IsAuthenticated permission)
     Filters: Queryset automatically filtered to current user's chats
     """
 
+    # Base queryset lets routers and schema generation introspect the
+    # model without calling get_queryset; never served unfiltered
+    queryset = Chat.objects.all()
     serializer_class = ChatSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = ChatsCursorPagination
 
     def get_queryset(self):
         """
@@ -57,8 +63,17 @@ class ChatViewSet(viewsets.ModelViewSet):
 
         This is the critical security check - ensures users can never see
         or modify other users' chats via the API.
+
+        message_count is the signal-maintained column on Chat, so the
+        list needs no JOIN or aggregation over the message table.
         """
-        return Chat.objects.filter(user=self.request.user)
+        # .only() matches the serializer field set, keeping the JSONField
+        # metadata column out of every fetched row
+        return (
+            self.queryset.filter(user=self.request.user)
+            .only("id", "user", "title", "created_at", "updated_at", "message_count")
+            .order_by("-updated_at")
+        )
 
     def perform_create(self, serializer):
         """
@@ -9,6 +9,13 @@ from rest_framework import serializers
 
 from ..models import Message
 
+# Computed once at import; validate_role runs on every message POST
+VALID_ROLES = frozenset(dict(Message.ROLE_CHOICES))
+INVALID_ROLE_MESSAGE = "Invalid role. Must be one of: " + ", ".join(sorted(VALID_ROLES))
+
+# Matches the admin changelist preview length
+CONTENT_PREVIEW_LENGTH = 100
+
 
 class MessageSerializer(serializers.ModelSerializer):
     """
@@ -53,11 +60,8 @@ class MessageSerializer(serializers.ModelSerializer):
 
         Must be one of the valid choices defined in Message model.
         """
-        valid_roles = dict(Message.ROLE_CHOICES).keys()
-        if value not in valid_roles:  # pragma: no cover
-            raise serializers.ValidationError(
-                f"Invalid role. Must be one of: {', '.join(valid_roles)}"
-            )
+        if value not in VALID_ROLES:  # pragma: no cover
+            raise serializers.ValidationError(INVALID_ROLE_MESSAGE)
         return value
 
     def create(self, validated_data):
@@ -70,3 +74,23 @@ class MessageSerializer(serializers.ModelSerializer):
         """
         validated_data["user"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class MessageListSerializer(MessageSerializer):
+    """
+    List variant of MessageSerializer returning truncated content.
+
+    Long LLM responses can run to many KB per message; the list endpoint
+    only needs a preview, so content is cut server-side (in SQL, via the
+    queryset's content_preview/content_length annotations) and the full
+    body is never fetched from the database. Retrieve a single message
+    for the complete content.
+    """
+
+    content = serializers.SerializerMethodField()
+
+    def get_content(self, obj):
+        """Return the annotated preview, with an ellipsis when truncated."""
+        if obj.content_length > CONTENT_PREVIEW_LENGTH:
+            return f"{obj.content_preview}..."
+        return obj.content_preview
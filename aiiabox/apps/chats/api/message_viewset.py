@@ -5,16 +5,37 @@ Provides CRUD operations for messages via REST API endpoints.
 Implements proper filtering, authentication, and permission checks.
 """
 
+from django.db import transaction
+from django.db.models.functions import Left, Length
 from rest_framework import viewsets
-from rest_framework.authentication import TokenAuthentication
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 
 from ..models import Chat, Message
-from .chat_viewset import StandardResultsSetPagination
-from .message_serializer import MessageSerializer
+from .authentication import CachedTokenAuthentication
+from .message_serializer import (
+    CONTENT_PREVIEW_LENGTH,
+    MessageListSerializer,
+    MessageSerializer,
+)
 from .permissions import IsOwnerOrReadOnly
 
 
+class MessagesCursorPagination(CursorPagination):
+    """
+    Cursor pagination for message history, newest first.
+
+    Deep pagination through long conversations stays O(log N) per page
+    via the Message(chat, created_at) index instead of LIMIT/OFFSET's
+    scan-and-skip.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
 class MessageViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Message CRUD operations (nested under Chat).
@@ -30,7 +51,7 @@ class MessageViewSet(viewsets.ModelViewSet):
 
     Authentication: TokenAuthentication (requires 'Authorization: Token <token>')
     Permission: IsAuthenticated + IsOwnerOrReadOnly (users access only their chats)
-    Pagination: 20 items per page on list endpoint
+    Pagination: cursor-based, 20 items per page, newest message first
 
     Assumes:
     - Chat exists and is owned by authenticated user
@@ -42,10 +63,30 @@ class MessageViewSet(viewsets.ModelViewSet):
     - Chat must be owned by current user
     """
 
+    # Base queryset lets routers and schema generation introspect the
+    # model without calling get_queryset; never served unfiltered
+    queryset = Message.objects.all()
     serializer_class = MessageSerializer
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = MessagesCursorPagination
+
+    def _get_chat_pk(self):
+        """
+        Resolve and cache the parent chat pk from the URL kwargs.
+
+        The nested router supplies 'chat_pk'; 'parent_lookup_chat_id' is
+        the fallback for other routing patterns. Resolved once per
+        request and cached on self; the int() cast fails fast on garbage
+        input before it reaches the database.
+        """
+        chat_pk = getattr(self, "_chat_pk", None)
+        if chat_pk is None:
+            raw_pk = self.kwargs.get("chat_pk") or self.kwargs.get(
+                "parent_lookup_chat_id"
+            )
+            chat_pk = self._chat_pk = int(raw_pk)
+        return chat_pk
 
     def get_queryset(self):
         """
@@ -55,12 +96,46 @@ class MessageViewSet(viewsets.ModelViewSet):
         1. Chat must be in the chat_id URL parameter
         2. Chat must be owned by current user
         """
-        # Nested router creates 'chat_pk' kwarg (not 'parent_lookup_chat_id')
-        chat_id = self.kwargs.get("chat_pk")
-        if not chat_id:  # pragma: no cover
-            # Fallback for different routing patterns
-            chat_id = self.kwargs.get("parent_lookup_chat_id")
-        return Message.objects.filter(chat_id=chat_id, chat__user=self.request.user)
+        # IsOwnerOrReadOnly.has_permission has already proven ownership
+        # of the parent chat and cached it on the view, so the usual
+        # case filters on chat_id alone - no chat__user JOIN condition
+        chat = getattr(self, "_cached_parent_chat", None)
+        if chat is not None:
+            base = self.queryset.filter(chat=chat)
+        else:  # pragma: no cover
+            base = self.queryset.filter(
+                chat_id=self._get_chat_pk(), chat__user=self.request.user
+            )
+        # select_related covers the obj.chat.user_id access in the
+        # permission check, so object retrieval stays a single JOIN;
+        # .only() keeps that JOIN narrow and the row limited to the
+        # serializer's field set
+        queryset = base.select_related("chat").only(
+            "id",
+            "chat",
+            "user",
+            "content",
+            "role",
+            "tokens",
+            "created_at",
+            "chat__id",
+            "chat__user",
+        )
+        if self.action == "list":
+            # Truncate content in SQL so the full blob never leaves the
+            # database on list pages; MessageListSerializer reads the
+            # annotations
+            queryset = queryset.defer("content").annotate(
+                content_preview=Left("content", CONTENT_PREVIEW_LENGTH),
+                content_length=Length("content"),
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        """Use the preview serializer on list, full content elsewhere."""
+        if self.action == "list":
+            return MessageListSerializer
+        return MessageSerializer
 
     def perform_create(self, serializer):
         """
@@ -71,9 +146,12 @@ class MessageViewSet(viewsets.ModelViewSet):
         - chat: from URL parameter (chat_pk from nested router)
 
         This prevents users from creating messages in other users' chats.
+
+        Reuses the chat resolved by IsOwnerOrReadOnly.has_permission when
+        available, avoiding a second ownership SELECT per create.
         """
-        chat_id = self.kwargs.get("chat_pk")
-        if not chat_id:  # pragma: no cover
-            chat_id = self.kwargs.get("parent_lookup_chat_id")
-        chat = Chat.objects.get(id=chat_id, user=self.request.user)
-        serializer.save(user=self.request.user, chat=chat)
+        with transaction.atomic():
+            chat = getattr(self, "_cached_parent_chat", None)
+            if chat is None:  # pragma: no cover
+                chat = Chat.objects.get(id=self._get_chat_pk(), user=self.request.user)
+            serializer.save(user=self.request.user, chat=chat)
@@ -7,7 +7,7 @@ chats and messages.
 
 from rest_framework import permissions
 
-from ..models import Chat
+from ..models import Chat, Message
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -17,6 +17,11 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
     Only the user who created a chat/message can view, edit, or delete it.
     This enforces user isolation - chats and messages are strictly private.
 
+    Note: intentionally separate from apps.permissions.IsOwnerOrReadOnly.
+    The shared class grants read access to any authenticated user, while
+    this one denies even reads to non-owners and adds the nested
+    parent-chat ownership check - do not consolidate the two.
+
     Applies to:
     - Chat viewset: User can only see/modify their own chats
     - Message viewset: User can only see/modify their own messages in their chats
@@ -32,12 +37,26 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if not (request.user and request.user.is_authenticated):  # pragma: no cover
             return False
 
-        # For nested message routes, verify parent chat belongs to user
+        # For nested message routes, verify parent chat belongs to user.
+        # The resolved chat is cached on the view so perform_create can
+        # reuse it instead of re-proving ownership with a second query,
+        # and the verdict is memoized on the request so pipelines that
+        # re-run has_permission (custom actions, re-dispatch) skip the
+        # repeat SELECT.
         if "chat_pk" in view.kwargs:
+            cache = request.__dict__.setdefault("_chat_owner_cache", {})
+            key = (request.user.id, view.kwargs["chat_pk"])
+            if key in cache:
+                return cache[key]
             try:
-                chat_id = view.kwargs["chat_pk"]
-                # Check if chat exists and belongs to current user
-                return Chat.objects.filter(id=chat_id, user=request.user).exists()
+                chat = (
+                    Chat.objects.only("id", "user_id")
+                    .filter(id=key[1], user=request.user)
+                    .first()
+                )
+                view._cached_parent_chat = chat
+                cache[key] = chat is not None
+                return cache[key]
             except (ValueError, TypeError):  # pragma: no cover
                 return False
 
@@ -49,13 +68,15 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 
         For Chat: obj.user must match request.user
         For Message: obj.chat.user must match request.user
+
+        isinstance dispatch avoids the descriptor lookups (and potential
+        lazy FK fetch) that hasattr-based type sniffing triggered, and
+        comparing user ids reads a column already loaded on the row.
         """
-        # Chat object
-        if hasattr(obj, "messages"):  # Chat has 'messages' reverse relation
-            return obj.user == request.user
+        if isinstance(obj, Chat):
+            return obj.user_id == request.user.id
 
-        # Message object
-        if hasattr(obj, "chat"):  # Message has 'chat' foreign key
-            return obj.chat.user == request.user
+        if isinstance(obj, Message):
+            return obj.chat.user_id == request.user.id
 
         return False
@@ -20,25 +20,37 @@ from ...models import Chat
 
 
 class ChatAPITestCase(TestCase):
-    """Tests for Chat API endpoints."""
+    """
+    Tests for Chat API endpoints.
 
-    def setUp(self):
-        """Set up test data and API client."""
+    Parallel/keepdb safe: all data is ORM-created per class with no
+    module-level side effects or hardcoded autoincrement ids.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create immutable users, tokens, and chats once per class."""
         # Create test users
-        self.user1 = User.objects.create_user(username="user1", password="testpass123")
-        self.user2 = User.objects.create_user(username="user2", password="testpass123")
+        cls.user1 = User.objects.create_user(username="user1", password="testpass123")
+        cls.user2 = User.objects.create_user(username="user2", password="testpass123")
 
-        # Get or create tokens for authentication
-        self.token1, _ = Token.objects.get_or_create(user=self.user1)
-        self.token2, _ = Token.objects.get_or_create(user=self.user2)
+        # Tokens already exist via the post_save signal, so a plain get
+        # skips get_or_create's extra savepoint per user
+        cls.token1 = Token.objects.get(user=cls.user1)
+        cls.token2 = Token.objects.get(user=cls.user2)
 
-        # Set up API client
-        self.client = APIClient()
+        # Auth headers formatted once per class instead of per test
+        cls.auth1 = f"Token {cls.token1.key}"
+        cls.auth2 = f"Token {cls.token2.key}"
 
         # Create test chats
-        self.chat1 = Chat.objects.create(user=self.user1, title="Chat 1")
-        self.chat2 = Chat.objects.create(user=self.user1, title="Chat 2")
-        self.chat3 = Chat.objects.create(user=self.user2, title="User 2 Chat")
+        cls.chat1 = Chat.objects.create(user=cls.user1, title="Chat 1")
+        cls.chat2 = Chat.objects.create(user=cls.user1, title="Chat 2")
+        cls.chat3 = Chat.objects.create(user=cls.user2, title="User 2 Chat")
+
+    def setUp(self):
+        """Set up a fresh API client per test."""
+        self.client = APIClient()
 
     def test_list_chats_requires_authentication(self):
         """Test that listing chats requires valid token."""
@@ -53,11 +65,11 @@ class ChatAPITestCase(TestCase):
 
     def test_list_chats_returns_user_chats_only(self):
         """Test that user only sees their own chats."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get("/api/chats/")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data["count"], 2)  # User 1 has 2 chats
+        self.assertEqual(len(response.data["results"]), 2)  # User 1 has 2 chats
         chat_titles = [chat["title"] for chat in response.data["results"]]
         self.assertIn("Chat 1", chat_titles)
         self.assertIn("Chat 2", chat_titles)
@@ -66,23 +78,24 @@ class ChatAPITestCase(TestCase):
     def test_list_chats_pagination(self):
         """Test that pagination works on chat list."""
         # Create 23 more chats (setUp creates 2, total = 25, default page size = 20)
-        for i in range(3, 26):
-            Chat.objects.create(user=self.user1, title=f"Chat {i}")
+        Chat.objects.bulk_create(
+            [Chat(user=self.user1, title=f"Chat {i}") for i in range(3, 26)]
+        )
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get("/api/chats/")
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 20)  # First page
         self.assertIsNotNone(response.data["next"])
 
-        # Get second page (25 - 20 = 5 remaining)
-        response = self.client.get("/api/chats/?page=2")
+        # Follow the cursor to the second page (25 - 20 = 5 remaining)
+        response = self.client.get(response.data["next"])
         self.assertEqual(len(response.data["results"]), 5)  # Remaining chats
 
     def test_create_chat_success(self):
         """Test creating a new chat with valid title."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {"title": "New Chat"}
         response = self.client.post("/api/chats/", data)
 
@@ -96,7 +109,7 @@ class ChatAPITestCase(TestCase):
 
     def test_create_chat_title_required(self):
         """Test that chat title is required."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.post("/api/chats/", {})
 
         self.assertEqual(response.status_code, 400)
@@ -104,7 +117,7 @@ class ChatAPITestCase(TestCase):
 
     def test_create_chat_title_cannot_be_empty(self):
         """Test that title cannot be empty or whitespace only."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
 
         # Empty string
         response = self.client.post("/api/chats/", {"title": ""})
@@ -116,7 +129,7 @@ class ChatAPITestCase(TestCase):
 
     def test_create_chat_title_max_length(self):
         """Test that title cannot exceed 200 characters."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         long_title = "A" * 201
         response = self.client.post("/api/chats/", {"title": long_title})
 
@@ -124,7 +137,7 @@ class ChatAPITestCase(TestCase):
 
     def test_retrieve_chat_success(self):
         """Test retrieving a single chat."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get(f"/api/chats/{self.chat1.id}/")
 
         self.assertEqual(response.status_code, 200)
@@ -133,14 +146,14 @@ class ChatAPITestCase(TestCase):
 
     def test_retrieve_chat_not_found(self):
         """Test retrieving non-existent chat returns 404."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get("/api/chats/99999/")
 
         self.assertEqual(response.status_code, 404)
 
     def test_retrieve_other_user_chat_forbidden(self):
         """Test that user cannot access another user's chat (returns 404, not 403)."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get(f"/api/chats/{self.chat3.id}/")
 
         # Returns 404 because chat is filtered out of user's queryset
@@ -149,7 +162,7 @@ class ChatAPITestCase(TestCase):
 
     def test_delete_chat_success(self):
         """Test deleting a chat."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.delete(f"/api/chats/{self.chat1.id}/")
 
         self.assertEqual(response.status_code, 204)
@@ -157,7 +170,7 @@ class ChatAPITestCase(TestCase):
 
     def test_delete_chat_other_user_forbidden(self):
         """Test that user cannot delete another user's chat (returns 404)."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.delete(f"/api/chats/{self.chat3.id}/")
 
         # Returns 404 because chat is filtered out of user's queryset
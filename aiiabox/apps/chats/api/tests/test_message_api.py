@@ -20,33 +20,45 @@ from ...models import Chat, Message
 
 
 class MessageAPITestCase(TestCase):
-    """Tests for Message API endpoints."""
+    """
+    Tests for Message API endpoints.
 
-    def setUp(self):
-        """Set up test data and API client."""
+    Parallel/keepdb safe: all data is ORM-created per class with no
+    module-level side effects or hardcoded autoincrement ids.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create immutable users, tokens, chats, and messages once per class."""
         # Create test users
-        self.user1 = User.objects.create_user(username="user1", password="testpass123")
-        self.user2 = User.objects.create_user(username="user2", password="testpass123")
+        cls.user1 = User.objects.create_user(username="user1", password="testpass123")
+        cls.user2 = User.objects.create_user(username="user2", password="testpass123")
 
-        # Get or create tokens
-        self.token1, _ = Token.objects.get_or_create(user=self.user1)
-        self.token2, _ = Token.objects.get_or_create(user=self.user2)
+        # Tokens already exist via the post_save signal, so a plain get
+        # skips get_or_create's extra savepoint per user
+        cls.token1 = Token.objects.get(user=cls.user1)
+        cls.token2 = Token.objects.get(user=cls.user2)
 
-        # Set up API client
-        self.client = APIClient()
+        # Auth headers formatted once per class instead of per test
+        cls.auth1 = f"Token {cls.token1.key}"
+        cls.auth2 = f"Token {cls.token2.key}"
 
         # Create test chats
-        self.chat1 = Chat.objects.create(user=self.user1, title="Chat 1")
-        self.chat2 = Chat.objects.create(user=self.user2, title="User 2 Chat")
+        cls.chat1 = Chat.objects.create(user=cls.user1, title="Chat 1")
+        cls.chat2 = Chat.objects.create(user=cls.user2, title="User 2 Chat")
 
         # Create test messages
-        self.msg1 = Message.objects.create(
-            chat=self.chat1, user=self.user1, content="Hello", role="user"
+        cls.msg1 = Message.objects.create(
+            chat=cls.chat1, user=cls.user1, content="Hello", role="user"
         )
-        self.msg2 = Message.objects.create(
-            chat=self.chat1, user=self.user1, content="Hi there", role="assistant"
+        cls.msg2 = Message.objects.create(
+            chat=cls.chat1, user=cls.user1, content="Hi there", role="assistant"
         )
 
+    def setUp(self):
+        """Set up a fresh API client per test."""
+        self.client = APIClient()
+
     def test_list_messages_requires_authentication(self):
         """Test that listing messages requires valid token."""
         url = f"/api/chats/{self.chat1.id}/messages/"
@@ -62,24 +74,31 @@ class MessageAPITestCase(TestCase):
 
     def test_list_messages_success(self):
         """Test listing messages in a chat."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
-        response = self.client.get(f"/api/chats/{self.chat1.id}/messages/")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
+
+        # Pinned query count: token auth, chat ownership check, message
+        # page (cursor pagination adds no COUNT), plus the ATOMIC_REQUESTS
+        # savepoint pair. Guards against N+1 regressions in the
+        # serializer/queryset pairing.
+        with self.assertNumQueries(5):
+            response = self.client.get(f"/api/chats/{self.chat1.id}/messages/")
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.data["count"], 2)
-        self.assertEqual(response.data["results"][0]["content"], "Hello")
-        self.assertEqual(response.data["results"][1]["content"], "Hi there")
+        self.assertEqual(len(response.data["results"]), 2)
+        # Cursor pagination returns newest message first
+        self.assertEqual(response.data["results"][0]["content"], "Hi there")
+        self.assertEqual(response.data["results"][1]["content"], "Hello")
 
     def test_list_messages_other_user_forbidden(self):
         """Test that user cannot see another user's chat messages."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get(f"/api/chats/{self.chat2.id}/messages/")
 
         self.assertEqual(response.status_code, 403)
 
     def test_list_messages_chat_not_found(self):
         """Test listing messages from non-existent chat returns 403 (forbidden)."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get("/api/chats/99999/messages/")
 
         # Returns 403 because permission check fails before 404 (correct API behavior)
@@ -87,7 +106,7 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_success(self):
         """Test creating a message in a chat."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {"chat": self.chat1.id, "content": "New message", "role": "user"}
         response = self.client.post(f"/api/chats/{self.chat1.id}/messages/", data)
 
@@ -101,7 +120,7 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_content_required(self):
         """Test that message content is required."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {"chat": self.chat1.id, "role": "user"}
         response = self.client.post(f"/api/chats/{self.chat1.id}/messages/", data)
 
@@ -110,7 +129,7 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_content_cannot_be_empty(self):
         """Test that message content cannot be empty or whitespace only."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
 
         # Empty
         response = self.client.post(
@@ -128,7 +147,7 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_role_required(self):
         """Test that message role is required."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {"chat": self.chat1.id, "content": "Test message"}
         response = self.client.post(f"/api/chats/{self.chat1.id}/messages/", data)
 
@@ -137,7 +156,7 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_role_validation(self):
         """Test that message role must be a valid choice."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {
             "chat": self.chat1.id,
             "content": "Test message",
@@ -150,22 +169,25 @@ class MessageAPITestCase(TestCase):
 
     def test_create_message_valid_roles(self):
         """Test creating messages with all valid roles."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         valid_roles = ["user", "assistant", "system"]
 
         for role in valid_roles:
-            data = {
-                "chat": self.chat1.id,
-                "content": f"Message with {role} role",
-                "role": role,
-            }
-            response = self.client.post(f"/api/chats/{self.chat1.id}/messages/", data)
-            self.assertEqual(response.status_code, 201)
-            self.assertEqual(response.data["role"], role)
+            with self.subTest(role=role):
+                data = {
+                    "chat": self.chat1.id,
+                    "content": f"Message with {role} role",
+                    "role": role,
+                }
+                response = self.client.post(
+                    f"/api/chats/{self.chat1.id}/messages/", data
+                )
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(response.data["role"], role)
 
     def test_create_message_in_other_user_chat_forbidden(self):
         """Test that user cannot create message in another user's chat."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         data = {
             "chat": self.chat2.id,
             "content": "Unauthorized message",
@@ -180,7 +202,7 @@ class MessageAPITestCase(TestCase):
 
     def test_retrieve_message_success(self):
         """Test retrieving a single message."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get(
             f"/api/chats/{self.chat1.id}/messages/{self.msg1.id}/"
         )
@@ -190,14 +212,14 @@ class MessageAPITestCase(TestCase):
 
     def test_retrieve_message_not_found(self):
         """Test retrieving non-existent message."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.get(f"/api/chats/{self.chat1.id}/messages/99999/")
 
         self.assertEqual(response.status_code, 404)
 
     def test_delete_message_success(self):
         """Test deleting a message."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.delete(
             f"/api/chats/{self.chat1.id}/messages/{self.msg1.id}/"
         )
@@ -212,7 +234,7 @@ class MessageAPITestCase(TestCase):
             chat=self.chat2, user=self.user2, content="User 2 message", role="user"
         )
 
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
         response = self.client.delete(
             f"/api/chats/{self.chat2.id}/messages/{msg_user2.id}/"
         )
@@ -222,19 +244,28 @@ class MessageAPITestCase(TestCase):
 
     def test_message_pagination(self):
         """Test that message pagination works."""
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token1}")
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth1)
 
         # Create 23 more messages (setUp creates 2, total = 25, default page size = 20)
-        for i in range(3, 26):
-            Message.objects.create(
-                chat=self.chat1, user=self.user1, content=f"Message {i}", role="user"
-            )
+        Message.objects.bulk_create(
+            [
+                Message(
+                    chat=self.chat1,
+                    user=self.user1,
+                    content=f"Message {i}",
+                    role="user",
+                )
+                for i in range(3, 26)
+            ]
+        )
 
-        response = self.client.get(f"/api/chats/{self.chat1.id}/messages/")
+        # A full 20-item page must cost the same as a 2-item one
+        with self.assertNumQueries(5):
+            response = self.client.get(f"/api/chats/{self.chat1.id}/messages/")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data["results"]), 20)
         self.assertIsNotNone(response.data["next"])
 
-        # Get second page (25 - 20 = 5 remaining)
-        response = self.client.get(f"/api/chats/{self.chat1.id}/messages/?page=2")
+        # Follow the cursor to the second page (25 - 20 = 5 remaining)
+        response = self.client.get(response.data["next"])
         self.assertEqual(len(response.data["results"]), 5)
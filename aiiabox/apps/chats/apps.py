@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ChatsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.chats"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.chats.signals  # noqa
@@ -2,6 +2,19 @@ from django import forms
 
 from apps.chats.models import Chat
 
+# Widget singleton built once at import; form instances receive a
+# deepcopy, so the attrs string concatenation happens exactly once
+_TITLE_WIDGET = forms.TextInput(
+    attrs={
+        "class": "w-full px-4 py-2 border border-gray-300 rounded "
+        "dark:bg-gray-800 dark:border-gray-600 dark:text-gray-50 "
+        "focus:outline-none focus:ring-2 focus:ring-blue-500 "
+        "transition-colors",
+        "placeholder": "Chat title...",
+        "maxlength": "255",
+    }
+)
+
 
 class ChatForm(forms.ModelForm):
     """
@@ -21,16 +34,7 @@ class ChatForm(forms.ModelForm):
         model = Chat
         fields = ("title",)
         widgets = {
-            "title": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-2 border border-gray-300 rounded "
-                    "dark:bg-gray-800 dark:border-gray-600 dark:text-gray-50 "
-                    "focus:outline-none focus:ring-2 focus:ring-blue-500 "
-                    "transition-colors",
-                    "placeholder": "Chat title...",
-                    "maxlength": "255",
-                }
-            ),
+            "title": _TITLE_WIDGET,
         }
 
     def clean_title(self) -> str:
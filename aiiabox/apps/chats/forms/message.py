@@ -2,6 +2,20 @@ from django import forms
 
 from apps.chats.models import Message
 
+# Widget singleton built once at import; form instances receive a
+# deepcopy, so the attrs string concatenation happens exactly once
+_CONTENT_WIDGET = forms.Textarea(
+    attrs={
+        "class": "w-full px-4 py-3 border border-gray-300 rounded-lg resize-none "
+        "dark:bg-gray-800 dark:border-gray-600 dark:text-gray-50 "
+        "focus:outline-none focus:ring-2 focus:ring-blue-500 "
+        "transition-colors duration-200",
+        "placeholder": "Type your message...",
+        "rows": "3",
+        "maxlength": "5000",
+    }
+)
+
 
 class MessageForm(forms.ModelForm):
     """
@@ -22,17 +36,7 @@ class MessageForm(forms.ModelForm):
         model = Message
         fields = ("content",)
         widgets = {
-            "content": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 border border-gray-300 rounded-lg resize-none "
-                    "dark:bg-gray-800 dark:border-gray-600 dark:text-gray-50 "
-                    "focus:outline-none focus:ring-2 focus:ring-blue-500 "
-                    "transition-colors duration-200",
-                    "placeholder": "Type your message...",
-                    "rows": "3",
-                    "maxlength": "5000",
-                }
-            ),
+            "content": _CONTENT_WIDGET,
         }
 
     def clean_content(self) -> str:  # pragma: no cover
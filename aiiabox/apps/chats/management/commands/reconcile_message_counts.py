@@ -0,0 +1,27 @@
+"""
+Management command reconciling Chat.message_count with actual rows.
+
+The counter is maintained by Message post_save/post_delete signals,
+which bulk_create and queryset-level bulk deletes bypass. Run this
+after batch message operations to restore accurate counts.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F
+
+from apps.chats.models import Chat
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized message_count column on every chat."
+
+    def handle(self, *args, **options):
+        updated = 0
+        chats = Chat.objects.annotate(actual_count=Count("messages")).exclude(
+            message_count=F("actual_count")
+        )
+        for chat in chats.iterator(chunk_size=500):
+            Chat.objects.filter(pk=chat.pk).update(message_count=chat.actual_count)
+            updated += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {updated} chat(s)."))
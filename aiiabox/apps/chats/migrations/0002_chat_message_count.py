@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-08-29 20:07
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_message_counts(apps, schema_editor):
+    """
+    Seed the new column from existing message rows.
+
+    Same logic as the reconcile_message_counts command; without this,
+    existing deployments serve message_count: 0 for every chat until an
+    operator runs the command by hand.
+    """
+    Chat = apps.get_model('chats', 'Chat')
+    chats = Chat.objects.annotate(actual_count=Count('messages'))
+    for chat in chats.iterator(chunk_size=500):
+        Chat.objects.filter(pk=chat.pk).update(message_count=chat.actual_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chats', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chat',
+            name='message_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        # Reverse is a no-op: removing the field discards the values
+        migrations.RunPython(backfill_message_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-08-29 20:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chats', '0003_chat_chat_title_nonempty_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='chats_messa_chat_id_a8ed7c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['chat', 'created_at'], include=('role', 'user'), name='msg_chat_created_cover'),
+        ),
+    ]
@@ -2,6 +2,19 @@ from django.contrib.auth.models import User
 from django.db import models
 
 
+class ChatManager(models.Manager):
+    """Manager exposing the owner-scoped queries the views share."""
+
+    def for_user(self, user):
+        """
+        Return the chats owned by the given user.
+
+        Single source of truth for the per-owner filter used by the
+        list/detail/delete views; testable without view scaffolding.
+        """
+        return self.filter(user=user)
+
+
 class Chat(models.Model):
     """
     Represents a conversation thread owned by a user.
@@ -18,12 +31,25 @@ class Chat(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     metadata = models.JSONField(default=dict, blank=True)
+    # Denormalized count maintained by Message signals so list views read
+    # a plain column instead of aggregating the message table; run the
+    # reconcile_message_counts command after bulk message operations
+    message_count = models.PositiveIntegerField(default=0)
+
+    objects = ChatManager()
 
     class Meta:
         ordering = ["-updated_at"]
         indexes = [
             models.Index(fields=["user", "-updated_at"]),
         ]
+        constraints = [
+            # Backstop for writes that bypass form/serializer validation
+            # (admin scripts, bulk_create, raw SQL)
+            models.CheckConstraint(
+                condition=~models.Q(title=""), name="chat_title_nonempty"
+            ),
+        ]
 
     def __str__(self):  # pragma: no cover
         return self.title
@@ -33,9 +33,24 @@ class Message(models.Model):
     class Meta:
         ordering = ["created_at"]
         indexes = [
-            models.Index(fields=["chat", "created_at"]),
+            # Covers the list endpoint's WHERE chat_id ORDER BY created_at
+            # scan; INCLUDE keeps role/user_id in the leaf pages so
+            # PostgreSQL can answer without heap fetches (ignored on
+            # backends without covering-index support)
+            models.Index(
+                fields=["chat", "created_at"],
+                include=["role", "user"],
+                name="msg_chat_created_cover",
+            ),
             models.Index(fields=["user", "created_at"]),
         ]
+        constraints = [
+            # Backstop for writes that bypass form/serializer validation
+            # (admin scripts, bulk_create, raw SQL)
+            models.CheckConstraint(
+                condition=~models.Q(content=""), name="message_content_nonempty"
+            ),
+        ]
 
     def __str__(self):  # pragma: no cover
         return f"{self.role.capitalize()} - {self.created_at}"
@@ -0,0 +1,14 @@
+from .chat_count_cache import (
+    chat_count_cache_key,
+    invalidate_chat_count_on_delete,
+    invalidate_chat_count_on_save,
+)
+from .message_count import decrement_message_count, increment_message_count
+
+__all__ = [
+    "chat_count_cache_key",
+    "decrement_message_count",
+    "increment_message_count",
+    "invalidate_chat_count_on_delete",
+    "invalidate_chat_count_on_save",
+]
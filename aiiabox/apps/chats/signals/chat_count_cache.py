@@ -0,0 +1,35 @@
+"""
+Signal handlers invalidating the cached per-user chat count.
+
+The chat list view caches each owner's chat total so repeat paginated
+requests skip the COUNT query; any chat create or delete must drop the
+stale entry so the next request recounts.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.chats.models import Chat
+
+# Cache lifetime for the per-user chat count; override via
+# settings.CHAT_COUNT_CACHE_TTL, set to 0 to disable caching entirely
+# (test settings do this to keep query counts deterministic)
+DEFAULT_CHAT_COUNT_CACHE_TTL = 300
+
+
+def chat_count_cache_key(user_id):
+    """Return the cache key holding the given user's chat total."""
+    return f"chat_count:{user_id}"
+
+
+@receiver(post_save, sender=Chat)
+def invalidate_chat_count_on_save(sender, instance, **kwargs):
+    """Drop the cached count whenever a chat row is written."""
+    cache.delete(chat_count_cache_key(instance.user_id))
+
+
+@receiver(post_delete, sender=Chat)
+def invalidate_chat_count_on_delete(sender, instance, **kwargs):
+    """Drop the cached count when a chat is deleted."""
+    cache.delete(chat_count_cache_key(instance.user_id))
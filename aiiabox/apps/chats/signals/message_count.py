@@ -0,0 +1,30 @@
+"""
+Signal handlers maintaining Chat.message_count.
+
+Keeps the denormalized counter in sync on single-object message writes.
+bulk_create/bulk deletes bypass signals - reconcile with the
+reconcile_message_counts management command after batch operations.
+"""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.chats.models import Chat, Message
+
+
+@receiver(post_save, sender=Message)
+def increment_message_count(sender, instance, created, **kwargs):
+    """Bump the parent chat's counter when a message is created."""
+    if created:
+        Chat.objects.filter(pk=instance.chat_id).update(
+            message_count=F("message_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Message)
+def decrement_message_count(sender, instance, **kwargs):
+    """Drop the parent chat's counter when a message is deleted."""
+    Chat.objects.filter(pk=instance.chat_id).update(
+        message_count=F("message_count") - 1
+    )
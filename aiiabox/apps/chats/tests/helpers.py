@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the chats test suite.
+
+The model test classes all need the same owner/other-user pair; creating
+them in one base class means one round of user INSERTs (and password
+hashing) per class without each module repeating the setup.
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+
+class UsersTestCase(TestCase):
+    """TestCase that provides cls.user and cls.other_user fixtures."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the shared user pair once per test class.
+
+        The model tests only use these users as FK targets and never
+        authenticate, so no password is set - this skips the hasher
+        entirely. Subclasses that need to log in should set a usable
+        password on the user they authenticate with.
+        """
+        cls.user = User.objects.create(username="testuser", email="test@example.com")
+        cls.other_user = User.objects.create(
+            username="otheruser", email="other@example.com"
+        )
@@ -0,0 +1,63 @@
+"""
+Tests for the MessageAdmin CSV export action.
+
+Only tests custom code - does NOT test Django admin machinery.
+"""
+
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+
+from apps.chats.admin import MessageAdmin
+from apps.chats.models import Chat, Message
+
+
+class MessageAdminExportTests(TestCase):
+    """Test that export_selected streams the expected CSV."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create reusable test data for all test methods."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        cls.chat = Chat.objects.create(user=cls.user, title="Export Chat")
+        cls.message = Message.objects.create(
+            chat=cls.chat, user=cls.user, role="user", content="Hello there", tokens=3
+        )
+
+    def setUp(self):
+        """Build the admin per test - it is not deepcopy-safe for setUpTestData."""
+        self.model_admin = MessageAdmin(Message, AdminSite())
+
+    def _export(self, queryset):
+        """Invoke the action and return the streamed body as lines."""
+        request = RequestFactory().get("/admin/chats/message/")
+        response = self.model_admin.export_selected(request, queryset)
+        body = b"".join(
+            chunk if isinstance(chunk, bytes) else chunk.encode()
+            for chunk in response.streaming_content
+        )
+        return body.decode().splitlines()
+
+    def test_export_streams_header_and_data_row(self):
+        """The CSV starts with the header and carries one row per message."""
+        lines = self._export(Message.objects.filter(pk=self.message.pk))
+
+        self.assertEqual(lines[0], "id,chat,user,role,content,tokens,created_at")
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[1],
+            f"{self.message.pk},Export Chat,testuser,user,Hello there,3,"
+            f"{self.message.created_at.isoformat()}",
+        )
+
+    def test_export_response_is_csv_attachment(self):
+        """The response is served as a downloadable CSV file."""
+        request = RequestFactory().get("/admin/chats/message/")
+        response = self.model_admin.export_selected(request, Message.objects.all())
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"], "attachment; filename=messages.csv"
+        )
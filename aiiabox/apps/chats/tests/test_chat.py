@@ -1,22 +1,15 @@
-from django.contrib.auth.models import User
-from django.test import TestCase
+from datetime import timedelta
+
+from django.db import IntegrityError
 from django.utils import timezone
 
 from apps.chats.models import Chat, Message
 
+from .helpers import UsersTestCase
 
-class ChatModelTests(TestCase):
-    """Test suite for Chat model."""
 
-    @classmethod
-    def setUpTestData(cls):
-        """Create reusable test data for all test methods."""
-        cls.user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-        cls.other_user = User.objects.create_user(
-            username="otheruser", email="other@example.com", password="otherpass123"
-        )
+class ChatModelTests(UsersTestCase):
+    """Test suite for Chat model."""
 
     def test_chat_creation_with_required_fields(self):
         """Test creating a chat with only required fields."""
@@ -35,7 +28,6 @@ class ChatModelTests(TestCase):
             user=self.user, title="Chat with Metadata", metadata=metadata
         )
 
-        chat.refresh_from_db()
         self.assertEqual(chat.metadata, metadata)
         self.assertEqual(chat.metadata["model"], "llama-2")
         self.assertEqual(chat.metadata["temperature"], 0.7)
@@ -63,12 +55,11 @@ class ChatModelTests(TestCase):
     def test_chat_updated_at_changes_on_update(self):
         """Test that updated_at changes when chat is modified."""
         chat = Chat.objects.create(user=self.user, title="Original Title")
-        original_updated = chat.updated_at
 
-        # Wait a moment to ensure timestamp difference
-        import time
-
-        time.sleep(0.01)
+        # Backdate via update() instead of sleeping - auto_now fields
+        # can't be set through save(), and a sleep is slow and flaky
+        original_updated = timezone.now() - timedelta(seconds=1)
+        Chat.objects.filter(pk=chat.pk).update(updated_at=original_updated)
 
         chat.title = "Updated Title"
         chat.save()
@@ -87,36 +78,36 @@ class ChatModelTests(TestCase):
         chat = Chat.objects.create(user=self.user, title="User Chat")
 
         self.assertEqual(chat.user.username, "testuser")
-        self.assertIn(chat, self.user.chats.all())
-
-    def test_multiple_chats_per_user(self):
-        """Test that a user can have multiple chats."""
-        chat1 = Chat.objects.create(user=self.user, title="Chat 1")
-        chat2 = Chat.objects.create(user=self.user, title="Chat 2")
-        chat3 = Chat.objects.create(user=self.user, title="Chat 3")
-
-        user_chats = self.user.chats.all()
-        self.assertEqual(user_chats.count(), 3)
-        self.assertIn(chat1, user_chats)
-        self.assertIn(chat2, user_chats)
-        self.assertIn(chat3, user_chats)
+        self.assertTrue(self.user.chats.filter(pk=chat.pk).exists())
+
+    def test_chat_user_isolation_and_membership(self):
+        """Test per-user chat counts, membership, and isolation together."""
+        # One shared fixture covers the multiple-chats, filtering-by-user
+        # and isolation assertions that used to be three separate tests
+        chat1, chat2, other_chat = Chat.objects.bulk_create(
+            [
+                Chat(user=self.user, title="Chat 1"),
+                Chat(user=self.user, title="Chat 2"),
+                Chat(user=self.other_user, title="Other User Chat"),
+            ]
+        )
 
-    def test_chats_isolated_by_user(self):
-        """Test that different users have separate chats."""
-        chat1 = Chat.objects.create(user=self.user, title="User 1 Chat")
-        chat2 = Chat.objects.create(user=self.other_user, title="User 2 Chat")
+        user_chat_ids = set(self.user.chats.values_list("id", flat=True))
+        other_chat_ids = set(self.other_user.chats.values_list("id", flat=True))
 
-        self.assertNotIn(chat2, self.user.chats.all())
-        self.assertNotIn(chat1, self.other_user.chats.all())
+        self.assertEqual(user_chat_ids, {chat1.pk, chat2.pk})
+        self.assertEqual(other_chat_ids, {other_chat.pk})
 
     def test_chat_default_ordering_by_updated_at(self):
         """Test that chats are ordered by updated_at descending."""
-        import time
-
         chat1 = Chat.objects.create(user=self.user, title="Old Chat")
-        time.sleep(0.01)
         chat2 = Chat.objects.create(user=self.user, title="New Chat")
 
+        # Force a deterministic gap instead of sleeping between creates
+        Chat.objects.filter(pk=chat1.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=1)
+        )
+
         chats = Chat.objects.filter(user=self.user)
         self.assertEqual(chats[0].id, chat2.id)
         self.assertEqual(chats[1].id, chat1.id)
@@ -132,12 +123,15 @@ class ChatModelTests(TestCase):
         )
 
         chat_id = chat.id
-        self.assertEqual(Message.objects.filter(chat_id=chat_id).count(), 2)
+        message_ids = set(
+            Message.objects.filter(chat_id=chat_id).values_list("id", flat=True)
+        )
+        self.assertEqual(len(message_ids), 2)
 
         chat.delete()
 
         self.assertFalse(Chat.objects.filter(id=chat_id).exists())
-        self.assertEqual(Message.objects.filter(chat_id=chat_id).count(), 0)
+        self.assertFalse(Message.objects.filter(chat_id=chat_id).exists())
 
     def test_chat_str_representation(self):
         """Test chat string representation returns title."""
@@ -157,17 +151,14 @@ class ChatModelTests(TestCase):
             user=self.user, title="Complex Metadata Chat", metadata=metadata
         )
 
-        chat.refresh_from_db()
         self.assertEqual(chat.metadata["settings"]["temperature"], 0.8)
         self.assertEqual(chat.metadata["tags"], ["important", "code-review"])
         self.assertEqual(chat.metadata["context"]["line"], 42)
 
-    def test_chat_with_empty_title_allowed(self):
-        """Test that empty title is technically allowed at model level."""
-        chat = Chat.objects.create(user=self.user, title="")
-
-        self.assertEqual(chat.title, "")
-        self.assertTrue(Chat.objects.filter(id=chat.id).exists())
+    def test_chat_with_empty_title_rejected(self):
+        """Test that the chat_title_nonempty constraint rejects empty titles."""
+        with self.assertRaises(IntegrityError):
+            Chat.objects.create(user=self.user, title="")
 
     def test_chat_metadata_can_be_modified_and_saved(self):
         """Test that metadata can be modified and persisted."""
@@ -179,35 +170,18 @@ class ChatModelTests(TestCase):
         chat.metadata["updated"] = True
         chat.save()
 
+        # The one refresh_from_db() in the metadata tests: this is the
+        # JSON serialization round-trip check, so the re-fetch is the
+        # point; the creation tests assert on the in-memory dict instead
         chat.refresh_from_db()
         self.assertEqual(chat.metadata["version"], 2)
         self.assertTrue(chat.metadata["updated"])
 
-    def test_chat_id_is_auto_incremented(self):
-        """Test that chat IDs are automatically assigned and unique."""
-        chat1 = Chat.objects.create(user=self.user, title="Chat 1")
-        chat2 = Chat.objects.create(user=self.user, title="Chat 2")
-
-        self.assertIsNotNone(chat1.id)
-        self.assertIsNotNone(chat2.id)
-        self.assertNotEqual(chat1.id, chat2.id)
-
-    def test_chat_queryset_filtering_by_user(self):
-        """Test filtering chats by specific user."""
-        Chat.objects.create(user=self.user, title="User 1 - Chat 1")
-        Chat.objects.create(user=self.user, title="User 1 - Chat 2")
-        Chat.objects.create(user=self.other_user, title="User 2 - Chat 1")
-
-        user_chats = Chat.objects.filter(user=self.user)
-        self.assertEqual(user_chats.count(), 2)
-
-        other_user_chats = Chat.objects.filter(user=self.other_user)
-        self.assertEqual(other_user_chats.count(), 1)
-
     def test_chat_queryset_count_total(self):
         """Test counting all chats."""
-        for i in range(5):
-            Chat.objects.create(user=self.user, title=f"Chat {i}")
+        Chat.objects.bulk_create(
+            [Chat(user=self.user, title=f"Chat {i}") for i in range(5)]
+        )
 
         self.assertEqual(Chat.objects.count(), 5)
 
@@ -218,22 +192,17 @@ class ChatModelTests(TestCase):
 
         self.assertEqual(Chat.objects.filter(user=self.user).count(), 3)
 
-    def test_chat_get_by_id(self):
-        """Test retrieving chat by ID."""
-        chat = Chat.objects.create(user=self.user, title="Get by ID Chat")
-
-        retrieved = Chat.objects.get(id=chat.id)
-        self.assertEqual(retrieved.title, "Get by ID Chat")
-
-    def test_chat_update_via_save(self):
-        """Test updating chat via save method."""
+    def test_chat_crud_roundtrip(self):
+        """Test that a chat persists through create, update, and re-fetch."""
+        # One INSERT serves both the get-by-id and update-via-save
+        # checks that used to be separate tests
         chat = Chat.objects.create(user=self.user, title="Original")
 
         chat.title = "Modified"
         chat.save()
 
-        retrieved = Chat.objects.get(id=chat.id)
-        self.assertEqual(retrieved.title, "Modified")
+        stored_title = Chat.objects.values_list("title", flat=True).get(id=chat.id)
+        self.assertEqual(stored_title, "Modified")
 
     def test_chat_delete(self):
         """Test deleting a specific chat."""
@@ -1,22 +1,21 @@
-from django.contrib.auth.models import User
-from django.test import TestCase
+from datetime import timedelta
+
+from django.db import IntegrityError
+from django.db.models import Count, Sum
 from django.utils import timezone
 
 from apps.chats.models import Chat, Message
 
+from .helpers import UsersTestCase
+
 
-class MessageModelTests(TestCase):
+class MessageModelTests(UsersTestCase):
     """Test suite for Message model."""
 
     @classmethod
     def setUpTestData(cls):
-        """Create reusable test data for all test methods."""
-        cls.user = User.objects.create_user(
-            username="testuser", email="test@example.com", password="testpass123"
-        )
-        cls.other_user = User.objects.create_user(
-            username="otheruser", email="other@example.com", password="otherpass123"
-        )
+        """Create the shared users plus the chat the messages belong to."""
+        super().setUpTestData()
         cls.chat = Chat.objects.create(user=cls.user, title="Test Chat")
 
     def test_message_creation_with_required_fields(self):
@@ -32,32 +31,20 @@ class MessageModelTests(TestCase):
         self.assertEqual(message.tokens, 0)
         self.assertIsNotNone(message.created_at)
 
-    def test_message_role_user(self):
-        """Test creating a message with user role."""
-        message = Message.objects.create(
-            chat=self.chat, user=self.user, content="User message", role="user"
-        )
-
-        self.assertEqual(message.role, "user")
-
-    def test_message_role_assistant(self):
-        """Test creating a message with assistant role."""
-        message = Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="Assistant message",
-            role="assistant",
-        )
-
-        self.assertEqual(message.role, "assistant")
-
-    def test_message_role_system(self):
-        """Test creating a message with system role."""
-        message = Message.objects.create(
-            chat=self.chat, user=self.user, content="System message", role="system"
-        )
-
-        self.assertEqual(message.role, "system")
+    def test_message_roles(self):
+        """Test creating a message with each supported role."""
+        # One test with subTest shares the savepoint and fixtures that
+        # three near-identical per-role tests each paid for
+        for role in ("user", "assistant", "system"):
+            with self.subTest(role=role):
+                message = Message.objects.create(
+                    chat=self.chat,
+                    user=self.user,
+                    content=f"{role} message",
+                    role=role,
+                )
+
+                self.assertEqual(message.role, role)
 
     def test_message_with_tokens(self):
         """Test creating a message with token count."""
@@ -98,8 +85,12 @@ class MessageModelTests(TestCase):
         )
 
         self.assertEqual(len(message.content), 10000)
-        retrieved = Message.objects.get(id=message.id)
-        self.assertEqual(retrieved.content, long_content)
+        # Fetch just the column under test - re-reading the full row
+        # would drag the 10 KB blob through model hydration for nothing
+        stored_content = Message.objects.values_list("content", flat=True).get(
+            id=message.id
+        )
+        self.assertEqual(stored_content, long_content)
 
     def test_message_chat_relationship(self):
         """Test that message is properly associated with chat."""
@@ -111,7 +102,7 @@ class MessageModelTests(TestCase):
         )
 
         self.assertEqual(message.chat.title, "Test Chat")
-        self.assertIn(message, self.chat.messages.all())
+        self.assertTrue(self.chat.messages.filter(pk=message.pk).exists())
 
     def test_message_user_relationship(self):
         """Test that message is properly associated with user."""
@@ -123,38 +114,48 @@ class MessageModelTests(TestCase):
         )
 
         self.assertEqual(message.user.username, "testuser")
-        self.assertIn(message, self.user.messages.all())
+        self.assertTrue(self.user.messages.filter(pk=message.pk).exists())
 
     def test_multiple_messages_in_single_chat(self):
         """Test that a chat can contain multiple messages."""
-        msg1 = Message.objects.create(
-            chat=self.chat, user=self.user, content="Message 1", role="user"
-        )
-        msg2 = Message.objects.create(
-            chat=self.chat, user=self.user, content="Message 2", role="assistant"
-        )
-        msg3 = Message.objects.create(
-            chat=self.chat, user=self.user, content="Message 3", role="user"
-        )
-
-        chat_messages = self.chat.messages.all()
-        self.assertEqual(chat_messages.count(), 3)
-        self.assertIn(msg1, chat_messages)
-        self.assertIn(msg2, chat_messages)
-        self.assertIn(msg3, chat_messages)
+        msg1, msg2, msg3 = Message.objects.bulk_create(
+            [
+                Message(
+                    chat=self.chat, user=self.user, content="Message 1", role="user"
+                ),
+                Message(
+                    chat=self.chat,
+                    user=self.user,
+                    content="Message 2",
+                    role="assistant",
+                ),
+                Message(
+                    chat=self.chat, user=self.user, content="Message 3", role="user"
+                ),
+            ]
+        )
+
+        # Single id fetch covers the count and all three memberships
+        chat_message_ids = set(self.chat.messages.values_list("id", flat=True))
+        self.assertEqual(len(chat_message_ids), 3)
+        self.assertIn(msg1.pk, chat_message_ids)
+        self.assertIn(msg2.pk, chat_message_ids)
+        self.assertIn(msg3.pk, chat_message_ids)
 
     def test_message_default_ordering_by_created_at(self):
         """Test that messages are ordered by created_at ascending."""
-        import time
-
         msg1 = Message.objects.create(
             chat=self.chat, user=self.user, content="First", role="user"
         )
-        time.sleep(0.01)
         msg2 = Message.objects.create(
             chat=self.chat, user=self.user, content="Second", role="assistant"
         )
 
+        # Force a deterministic gap instead of sleeping between creates
+        Message.objects.filter(pk=msg1.pk).update(
+            created_at=timezone.now() - timedelta(seconds=1)
+        )
+
         messages = Message.objects.filter(chat=self.chat)
         self.assertEqual(messages[0].id, msg1.id)
         self.assertEqual(messages[1].id, msg2.id)
@@ -192,30 +193,16 @@ class MessageModelTests(TestCase):
             chat=self.chat, user=self.user, content="Test message", role="user"
         )
 
-        str_repr = str(message)
-        self.assertIn("User", str_repr)
-        self.assertIn("2025", str_repr)
+        # Assert the format contract instead of the current year - the
+        # old `"2025" in str_repr` check started failing on Jan 1 2026
+        self.assertRegex(str(message), r"^User - \d{4}-\d{2}-\d{2}")
 
-    def test_message_id_is_auto_incremented(self):
-        """Test that message IDs are automatically assigned and unique."""
-        msg1 = Message.objects.create(
-            chat=self.chat, user=self.user, content="Message 1", role="user"
-        )
-        msg2 = Message.objects.create(
-            chat=self.chat, user=self.user, content="Message 2", role="user"
-        )
-
-        self.assertIsNotNone(msg1.id)
-        self.assertIsNotNone(msg2.id)
-        self.assertNotEqual(msg1.id, msg2.id)
-
-    def test_message_empty_content_allowed(self):
-        """Test that empty content is technically allowed at model level."""
-        message = Message.objects.create(
-            chat=self.chat, user=self.user, content="", role="user"
-        )
-
-        self.assertEqual(message.content, "")
+    def test_message_empty_content_rejected(self):
+        """Test that the message_content_nonempty constraint rejects empty content."""
+        with self.assertRaises(IntegrityError):
+            Message.objects.create(
+                chat=self.chat, user=self.user, content="", role="user"
+            )
 
     def test_message_with_special_characters(self):
         """Test that message can store special characters and unicode."""
@@ -224,29 +211,44 @@ class MessageModelTests(TestCase):
             chat=self.chat, user=self.user, content=special_content, role="user"
         )
 
-        retrieved = Message.objects.get(id=message.id)
-        self.assertEqual(retrieved.content, special_content)
+        stored_content = Message.objects.values_list("content", flat=True).get(
+            id=message.id
+        )
+        self.assertEqual(stored_content, special_content)
 
     def test_message_queryset_filter_by_role(self):
         """Test filtering messages by role."""
-        Message.objects.create(
-            chat=self.chat, user=self.user, content="User message 1", role="user"
-        )
-        Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="Assistant response",
-            role="assistant",
-        )
-        Message.objects.create(
-            chat=self.chat, user=self.user, content="User message 2", role="user"
-        )
-
-        user_messages = Message.objects.filter(role="user")
-        self.assertEqual(user_messages.count(), 2)
-
-        assistant_messages = Message.objects.filter(role="assistant")
-        self.assertEqual(assistant_messages.count(), 1)
+        Message.objects.bulk_create(
+            [
+                Message(
+                    chat=self.chat,
+                    user=self.user,
+                    content="User message 1",
+                    role="user",
+                ),
+                Message(
+                    chat=self.chat,
+                    user=self.user,
+                    content="Assistant response",
+                    role="assistant",
+                ),
+                Message(
+                    chat=self.chat,
+                    user=self.user,
+                    content="User message 2",
+                    role="user",
+                ),
+            ]
+        )
+
+        # One grouped aggregation replaces a COUNT round-trip per role
+        counts = dict(
+            Message.objects.filter(chat=self.chat)
+            .values_list("role")
+            .annotate(Count("id"))
+        )
+        self.assertEqual(counts["user"], 2)
+        self.assertEqual(counts["assistant"], 1)
 
     def test_message_queryset_filter_by_chat(self):
         """Test filtering messages by specific chat."""
@@ -259,11 +261,10 @@ class MessageModelTests(TestCase):
             chat=other_chat, user=self.user, content="Chat 2 message", role="user"
         )
 
-        chat1_messages = Message.objects.filter(chat=self.chat)
-        self.assertEqual(chat1_messages.count(), 1)
-
-        chat2_messages = Message.objects.filter(chat=other_chat)
-        self.assertEqual(chat2_messages.count(), 1)
+        # One grouped aggregation replaces a COUNT round-trip per chat
+        counts = dict(Message.objects.values_list("chat_id").annotate(Count("id")))
+        self.assertEqual(counts[self.chat.id], 1)
+        self.assertEqual(counts[other_chat.id], 1)
 
     def test_message_queryset_filter_by_user(self):
         """Test filtering messages by specific user."""
@@ -274,11 +275,10 @@ class MessageModelTests(TestCase):
             chat=self.chat, user=self.other_user, content="User 2 message", role="user"
         )
 
-        user1_messages = Message.objects.filter(user=self.user)
-        self.assertEqual(user1_messages.count(), 1)
-
-        user2_messages = Message.objects.filter(user=self.other_user)
-        self.assertEqual(user2_messages.count(), 1)
+        # One grouped aggregation replaces a COUNT round-trip per user
+        counts = dict(Message.objects.values_list("user_id").annotate(Count("id")))
+        self.assertEqual(counts[self.user.id], 1)
+        self.assertEqual(counts[self.other_user.id], 1)
 
     def test_message_bulk_create(self):
         """Test creating multiple messages in bulk."""
@@ -295,17 +295,10 @@ class MessageModelTests(TestCase):
 
         self.assertEqual(Message.objects.filter(chat=self.chat).count(), 5)
 
-    def test_message_get_by_id(self):
-        """Test retrieving message by ID."""
-        message = Message.objects.create(
-            chat=self.chat, user=self.user, content="Get by ID test", role="user"
-        )
-
-        retrieved = Message.objects.get(id=message.id)
-        self.assertEqual(retrieved.content, "Get by ID test")
-
-    def test_message_update_via_save(self):
-        """Test updating message via save method."""
+    def test_message_crud_roundtrip(self):
+        """Test that a message persists through create, update, and re-fetch."""
+        # One INSERT serves both the get-by-id and update-via-save
+        # checks that used to be separate tests
         message = Message.objects.create(
             chat=self.chat,
             user=self.user,
@@ -318,9 +311,8 @@ class MessageModelTests(TestCase):
         message.tokens = 20
         message.save()
 
-        retrieved = Message.objects.get(id=message.id)
-        self.assertEqual(retrieved.content, "Updated content")
-        self.assertEqual(retrieved.tokens, 20)
+        stored = Message.objects.values_list("content", "tokens").get(id=message.id)
+        self.assertEqual(stored, ("Updated content", 20))
 
     def test_message_delete(self):
         """Test deleting a specific message."""
@@ -356,46 +348,29 @@ class MessageModelTests(TestCase):
 
     def test_message_conversation_flow(self):
         """Test a realistic conversation flow with multiple messages."""
-        Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="What is Django?",
-            role="user",
-            tokens=5,
-        )
-        Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="Django is a web framework...",
-            role="assistant",
-            tokens=45,
-        )
-        Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="Can you explain ORM?",
-            role="user",
-            tokens=7,
-        )
-        Message.objects.create(
-            chat=self.chat,
-            user=self.user,
-            content="The ORM allows you to...",
-            role="assistant",
-            tokens=38,
+        turns = [
+            ("What is Django?", "user", 5),
+            ("Django is a web framework...", "assistant", 45),
+            ("Can you explain ORM?", "user", 7),
+            ("The ORM allows you to...", "assistant", 38),
+        ]
+        Message.objects.bulk_create(
+            [
+                Message(chat=self.chat, user=self.user, content=c, role=r, tokens=t)
+                for c, r, t in turns
+            ]
         )
 
-        messages = self.chat.messages.all()
-        self.assertEqual(messages.count(), 4)
-
-        # Verify conversation order
-        self.assertEqual(messages[0].content, "What is Django?")
-        self.assertEqual(messages[1].role, "assistant")
-        self.assertEqual(messages[2].content, "Can you explain ORM?")
-        self.assertEqual(messages[3].role, "assistant")
+        # bulk_create stamps identical created_at values, so order by id
+        # (assigned in insertion order) and compare the column tuples
+        # directly instead of hydrating every row
+        stored_turns = list(
+            self.chat.messages.order_by("id").values_list("content", "role")
+        )
+        self.assertEqual(stored_turns, [(c, r) for c, r, _ in turns])
 
-        # Verify token counts
-        total_tokens = sum(msg.tokens for msg in messages)
+        # Sum tokens in SQL rather than looping over hydrated instances
+        total_tokens = self.chat.messages.aggregate(total=Sum("tokens"))["total"]
         self.assertEqual(total_tokens, 95)
 
     def test_message_tokens_cannot_be_negative(self):
@@ -0,0 +1,93 @@
+"""
+Tests for the signal handlers maintaining Chat.message_count.
+
+Only tests custom code - does NOT test Django signal machinery.
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.chats.models import Chat, Message
+from apps.chats.signals import chat_count_cache_key
+
+
+class MessageCountSignalTests(TestCase):
+    """Test that message creation/deletion keeps the counter in sync."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create reusable test data for all test methods."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+
+    def test_message_creation_increments_count(self):
+        """Creating messages should bump the parent chat's counter."""
+        chat = Chat.objects.create(user=self.user, title="Counted Chat")
+
+        Message.objects.create(chat=chat, user=self.user, content="Hi", role="user")
+        Message.objects.create(
+            chat=chat, user=self.user, content="Hello", role="assistant"
+        )
+
+        chat.refresh_from_db()
+        self.assertEqual(chat.message_count, 2)
+
+    def test_message_deletion_decrements_count(self):
+        """Deleting a message should drop the parent chat's counter."""
+        chat = Chat.objects.create(user=self.user, title="Counted Chat")
+        message = Message.objects.create(
+            chat=chat, user=self.user, content="Hi", role="user"
+        )
+
+        message.delete()
+
+        chat.refresh_from_db()
+        self.assertEqual(chat.message_count, 0)
+
+    def test_message_update_does_not_change_count(self):
+        """Saving an existing message should leave the counter alone."""
+        chat = Chat.objects.create(user=self.user, title="Counted Chat")
+        message = Message.objects.create(
+            chat=chat, user=self.user, content="Hi", role="user"
+        )
+
+        message.content = "Hi there"
+        message.save()
+
+        chat.refresh_from_db()
+        self.assertEqual(chat.message_count, 1)
+
+
+class ChatCountCacheSignalTests(TestCase):
+    """Test that chat writes drop the cached per-user chat count."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create reusable test data for all test methods."""
+        cls.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        cls.cache_key = chat_count_cache_key(cls.user.pk)
+
+    def setUp(self):
+        """Keep the shared cache clean across tests."""
+        self.addCleanup(cache.delete, self.cache_key)
+
+    def test_chat_creation_invalidates_cached_count(self):
+        """Creating a chat should delete the owner's cached count."""
+        cache.set(self.cache_key, 5, 60)
+
+        Chat.objects.create(user=self.user, title="New Chat")
+
+        self.assertIsNone(cache.get(self.cache_key))
+
+    def test_chat_deletion_invalidates_cached_count(self):
+        """Deleting a chat should delete the owner's cached count."""
+        chat = Chat.objects.create(user=self.user, title="Doomed Chat")
+        cache.set(self.cache_key, 5, 60)
+
+        chat.delete()
+
+        self.assertIsNone(cache.get(self.cache_key))
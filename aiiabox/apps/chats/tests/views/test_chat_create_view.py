@@ -1,11 +1,21 @@
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
+from apps.chats.forms import ChatForm
 from apps.chats.models import Chat
 from apps.chats.views import ChatCreateView
 
 
+class ChatCreateViewConfigTests(SimpleTestCase):
+    """Attribute checks on ChatCreateView - no database, so SimpleTestCase."""
+
+    def test_uses_chatform(self):
+        """ChatCreateView uses ChatForm."""
+        view = ChatCreateView()
+        self.assertEqual(view.form_class, ChatForm)
+
+
 class ChatCreateViewTests(TestCase):
     """Tests for ChatCreateView - focus on user assignment and form handling."""
 
@@ -16,58 +26,37 @@ class ChatCreateViewTests(TestCase):
             username="testuser", email="user@test.com", password="testpass123"
         )
 
-    def setUp(self):
-        """Set up for each test."""
-        self.url = reverse("chats:chat_create")
+        # Resolve constant URLs once per class instead of per test
+        cls.url = reverse("chats:chat_create")
+        cls.login_url = reverse("core:login")
 
     def test_requires_authentication(self):
         """ChatCreateView requires authentication."""
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 302)
-        expected_login_url = reverse("core:login")
-        self.assertIn(expected_login_url, response.url)
-
-    def test_uses_chatform(self):
-        """ChatCreateView uses ChatForm."""
-        from apps.chats.forms import ChatForm
-
-        view = ChatCreateView()
-        self.assertEqual(view.form_class, ChatForm)
+        self.assertTrue(response.url.startswith(self.login_url))
 
     def test_creates_chat_with_valid_title(self):
-        """ChatCreateView creates chat with valid title."""
-        self.client.login(username="testuser", password="testpass123")
+        """ChatCreateView creates chat and assigns request.user in form_valid()."""
+        self.client.force_login(self.user)
         data = {"title": "My New Chat"}
 
-        # Should create chat
         self.client.post(self.url, data)
 
+        # One POST covers both creation and the automatic user
+        # assignment that used to be asserted by a duplicate test
         chat = Chat.objects.get(title="My New Chat")
         self.assertEqual(chat.user, self.user)
 
-    def test_user_auto_assigned_on_create(self):
-        """Chat.user is automatically set to request.user in form_valid()."""
-        self.client.login(username="testuser", password="testpass123")
-        data = {"title": "New Chat"}
-
-        self.client.post(self.url, data)
-
-        chat = Chat.objects.get(title="New Chat")
-        self.assertEqual(chat.user, self.user)
-
     def test_form_validation_empty_title(self):
         """Form validation rejects empty title."""
-        from apps.chats.forms import ChatForm
-
         form = ChatForm(data={"title": ""})
         self.assertFalse(form.is_valid())
         self.assertIn("title", form.errors)
 
     def test_form_validation_whitespace_trimming(self):
         """Form trims whitespace from title."""
-        from apps.chats.forms import ChatForm
-
         form = ChatForm(data={"title": "  Chat Title  "})
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data["title"], "Chat Title")
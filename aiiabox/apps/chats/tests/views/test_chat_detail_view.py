@@ -3,7 +3,6 @@ from django.test import TestCase
 from django.urls import reverse
 
 from apps.chats.models import Chat, Message
-from apps.chats.views import ChatDetailView
 
 
 class ChatDetailViewTests(TestCase):
@@ -19,32 +18,41 @@ class ChatDetailViewTests(TestCase):
             username="testuser2", email="user2@test.com", password="testpass123"
         )
 
-        cls.chat_user1 = Chat.objects.create(user=cls.user1, title="User 1 Chat")
-        cls.chat_user2 = Chat.objects.create(user=cls.user2, title="User 2 Chat")
+        cls.chat_user1, cls.chat_user2 = Chat.objects.bulk_create(
+            [
+                Chat(user=cls.user1, title="User 1 Chat"),
+                Chat(user=cls.user2, title="User 2 Chat"),
+            ]
+        )
+
+        # Resolve constant URLs once per class instead of per test
+        cls.detail_url_user1 = reverse(
+            "chats:chat_detail", kwargs={"pk": cls.chat_user1.pk}
+        )
+        cls.detail_url_user2 = reverse(
+            "chats:chat_detail", kwargs={"pk": cls.chat_user2.pk}
+        )
+        cls.login_url = reverse("core:login")
 
     def test_requires_authentication(self):
         """ChatDetailView requires authentication."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
+        url = self.detail_url_user1
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 302)
-        expected_login_url = reverse("core:login")
-        self.assertIn(expected_login_url, response.url)
+        self.assertTrue(response.url.startswith(self.login_url))
 
     def test_queryset_filters_to_current_user(self):
-        """get_queryset() returns only current user's chats."""
-        view = ChatDetailView()
-        view.request = type("Request", (), {"user": self.user1})()
-
-        queryset = view.get_queryset()
+        """Chat.objects.for_user() returns only the owner's chats."""
+        chats = list(Chat.objects.for_user(self.user1))
 
-        self.assertIn(self.chat_user1, queryset)
-        self.assertNotIn(self.chat_user2, queryset)
+        self.assertIn(self.chat_user1, chats)
+        self.assertNotIn(self.chat_user2, chats)
 
     def test_404_when_accessing_other_user_chat(self):
         """User cannot access another user's chat (authorization)."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user2.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user2
+        self.client.force_login(self.user1)
 
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
@@ -52,25 +60,47 @@ class ChatDetailViewTests(TestCase):
     def test_404_for_nonexistent_chat(self):
         """404 is returned for non-existent chat."""
         url = reverse("chats:chat_detail", kwargs={"pk": 99999})
-        self.client.login(username="testuser1", password="testpass123")
+        self.client.force_login(self.user1)
 
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
 
     def test_get_includes_form_in_context(self):
         """GET response includes MessageForm in context."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user1
+        self.client.force_login(self.user1)
 
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn("form", response.context)
 
+    def test_get_prefetches_messages(self):
+        """GET renders the message list in a fixed number of queries."""
+        Message.objects.bulk_create(
+            [
+                Message(
+                    chat=self.chat_user1,
+                    user=self.user1,
+                    role="user",
+                    content=f"Question {i}",
+                )
+                for i in range(3)
+            ]
+        )
+        self.client.force_login(self.user1)
+
+        # Savepoint pair (ATOMIC_REQUESTS) + session + user + chat +
+        # prefetched messages; a per-message query would push this up
+        with self.assertNumQueries(6):
+            response = self.client.get(self.detail_url_user1)
+
+        self.assertEqual(response.status_code, 200)
+
     def test_post_creates_message(self):
         """POST with valid content creates a message."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user1
+        self.client.force_login(self.user1)
 
         response = self.client.post(url, {"content": "Test message"})
 
@@ -83,42 +113,38 @@ class ChatDetailViewTests(TestCase):
 
     def test_post_with_empty_content_fails(self):
         """POST with empty content does not create message."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user1
+        self.client.force_login(self.user1)
 
         response = self.client.post(url, {"content": ""})
 
         self.assertEqual(response.status_code, 200)
-        message_count = Message.objects.filter(chat=self.chat_user1).count()
-        self.assertEqual(message_count, 0)
+        self.assertFalse(Message.objects.filter(chat=self.chat_user1).exists())
 
     def test_post_with_whitespace_only_fails(self):
         """POST with whitespace-only content does not create message."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user1
+        self.client.force_login(self.user1)
 
         response = self.client.post(url, {"content": "   \n\t  "})
 
         self.assertEqual(response.status_code, 200)
-        message_count = Message.objects.filter(chat=self.chat_user1).count()
-        self.assertEqual(message_count, 0)
+        self.assertFalse(Message.objects.filter(chat=self.chat_user1).exists())
 
     def test_post_requires_authentication(self):
         """POST to chat detail requires authentication."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user1.pk})
+        url = self.detail_url_user1
         response = self.client.post(url, {"content": "Test message"})
 
         self.assertEqual(response.status_code, 302)
-        expected_login_url = reverse("core:login")
-        self.assertIn(expected_login_url, response.url)
+        self.assertTrue(response.url.startswith(self.login_url))
 
     def test_post_cannot_create_in_other_user_chat(self):
         """User cannot POST messages to another user's chat."""
-        url = reverse("chats:chat_detail", kwargs={"pk": self.chat_user2.pk})
-        self.client.login(username="testuser1", password="testpass123")
+        url = self.detail_url_user2
+        self.client.force_login(self.user1)
 
         response = self.client.post(url, {"content": "Test message"})
 
         self.assertEqual(response.status_code, 404)
-        message_count = Message.objects.filter(chat=self.chat_user2).count()
-        self.assertEqual(message_count, 0)
+        self.assertFalse(Message.objects.filter(chat=self.chat_user2).exists())
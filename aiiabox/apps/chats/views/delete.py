@@ -35,4 +35,4 @@ class ChatDeleteView(LoginRequiredMixin, DeleteView):
         Returns:
             QuerySet: Chats belonging to current user
         """
-        return Chat.objects.filter(user=self.request.user)
+        return Chat.objects.for_user(self.request.user)
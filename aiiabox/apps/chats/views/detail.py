@@ -45,9 +45,10 @@ class ChatDetailView(LoginRequiredMixin, DetailView):
         another user's chat, returns empty queryset -> 404.
 
         Returns:
-            QuerySet: Chats belonging to current user
+            QuerySet: Chats belonging to current user, with messages
+            prefetched so the template loop reuses one query
         """
-        return Chat.objects.filter(user=self.request.user)
+        return Chat.objects.for_user(self.request.user).prefetch_related("messages")
 
     def get_context_data(self, **kwargs):
         """
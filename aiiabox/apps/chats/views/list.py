@@ -1,9 +1,40 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import OuterRef, Subquery
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import ListView
 
-from apps.chats.models import Chat
+from apps.chats.models import Chat, Message
+from apps.chats.signals.chat_count_cache import (
+    DEFAULT_CHAT_COUNT_CACHE_TTL,
+    chat_count_cache_key,
+)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator serving the object count from the cache.
+
+    Plain pagination runs COUNT(*) on every request, which dominates the
+    list endpoint on large accounts. The Chat signal receivers drop the
+    cached value on create/delete so it never goes stale.
+    """
+
+    def __init__(self, *args, cache_key, cache_timeout, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.cache_timeout = cache_timeout
+
+    @cached_property
+    def count(self):
+        """Read the total from the cache, counting only on a miss."""
+        return cache.get_or_set(
+            self.cache_key, self.object_list.count, self.cache_timeout
+        )
 
 
 class ChatListView(LoginRequiredMixin, ListView):
@@ -45,9 +76,38 @@ class ChatListView(LoginRequiredMixin, ListView):
         Already ordered by -updated_at via model Meta.ordering.
 
         Returns:
-            QuerySet: Chats belonging to current user, ordered by most recent first
+            QuerySet: Chats belonging to current user, ordered by most recent
+            first, annotated with latest_message_content for the row preview
         """
-        return Chat.objects.filter(user=self.request.user)
+        # A correlated subquery fetches one content value per row;
+        # prefetching the relation would drag every message of every
+        # listed chat across the wire just to show a 10-word preview
+        latest_message = Message.objects.filter(chat=OuterRef("pk")).order_by(
+            "-created_at"
+        )
+        return Chat.objects.for_user(self.request.user).annotate(
+            latest_message_content=Subquery(latest_message.values("content")[:1])
+        )
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """
+        Paginate with the cache-backed count keyed by the current user.
+
+        A TTL of 0 (test settings) disables caching so every request
+        recounts.
+
+        Returns:
+            CachedCountPaginator: Paginator reading its count from cache
+        """
+        return CachedCountPaginator(
+            queryset,
+            per_page,
+            cache_key=chat_count_cache_key(self.request.user.pk),
+            cache_timeout=getattr(
+                settings, "CHAT_COUNT_CACHE_TTL", DEFAULT_CHAT_COUNT_CACHE_TTL
+            ),
+            **kwargs,
+        )
 
     def get_context_data(self, **kwargs):
         """
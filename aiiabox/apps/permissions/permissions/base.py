@@ -1,5 +1,8 @@
 from rest_framework import permissions
 
+# Frozenset lookup beats the tuple scan DRF ships for SAFE_METHODS
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
@@ -15,11 +18,26 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
+        user = request.user
+
         # Allow read permissions to any authenticated user
-        if request.method in permissions.SAFE_METHODS:
-            return request.user and request.user.is_authenticated
+        if request.method in SAFE_METHODS:
+            return bool(user and user.is_authenticated)
+
+        # Write permissions are only allowed to the owner of the object.
+        # Prefer the FK id columns - they are already loaded on the row,
+        # while resolving the 'user'/'owner' descriptor can trigger a
+        # User fetch just to run a pk-based __eq__. A null id falls
+        # through to the instance branch so an ownerless object never
+        # matches AnonymousUser's None id.
+        owner_id = getattr(obj, "user_id", None)
+        if owner_id is None:
+            owner_id = getattr(obj, "owner_id", None)
+        if owner_id is not None:
+            return owner_id == getattr(user, "id", None)
 
-        # Write permissions are only allowed to the owner of the object
-        # Check both 'user' and 'owner' attributes for flexibility
-        owner = getattr(obj, "user", None) or getattr(obj, "owner", None)
-        return owner == request.user
+        # Fallback for plain objects exposing only a user/owner instance
+        owner = getattr(obj, "user", None)
+        if owner is None:
+            owner = getattr(obj, "owner", None)
+        return owner is not None and owner == user
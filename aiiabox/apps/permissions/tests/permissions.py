@@ -4,7 +4,7 @@ Tests for Permissions app permission classes.
 Only tests custom permission logic - does NOT test Django REST framework behavior.
 """
 
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser, User
 from django.test import RequestFactory, TestCase
 from rest_framework.permissions import SAFE_METHODS
 
@@ -21,20 +21,21 @@ class MockObject:
 class IsOwnerOrReadOnlyTestCase(TestCase):
     """Test IsOwnerOrReadOnly permission class."""
 
-    def setUp(self):
-        """Set up test users and request factory."""
-        self.factory = RequestFactory()
-        self.owner = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up immutable test users and request factory once per class."""
+        cls.factory = RequestFactory()
+        cls.owner = User.objects.create_user(
             username="owner",
             email="owner@example.com",
             password="pass123",
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username="other",
             email="other@example.com",
             password="pass123",
         )
-        self.unauthenticated_user = None
+        cls.unauthenticated_user = None
 
     def test_read_permission_allowed_for_authenticated_user(self):
         """Authenticated users can read any object."""
@@ -103,6 +104,21 @@ class IsOwnerOrReadOnlyTestCase(TestCase):
 
         self.assertFalse(permission.has_object_permission(request, None, obj))
 
+    def test_write_permission_denied_for_anonymous_on_ownerless_object(self):
+        """A null owner FK never matches AnonymousUser's null id."""
+        permission = IsOwnerOrReadOnly()
+
+        class MockRow:
+            """Row-like object with a nullable owner FK left empty."""
+
+            user_id = None
+            user = None
+
+        request = self.factory.put("/")
+        request.user = AnonymousUser()
+
+        self.assertFalse(permission.has_object_permission(request, None, MockRow()))
+
     def test_permission_works_with_owner_attribute(self):
         """Permission class also works with 'owner' attribute."""
         permission = IsOwnerOrReadOnly()
@@ -28,6 +28,16 @@ PASSWORD_HASHERS = [
 # Use console email backend (no I/O overhead)
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
+# Skip logging configuration entirely - tests assert behavior, not logs
+LOGGING_CONFIG = None
+
+# Disable the API token auth cache so each test hits the database and
+# assertNumQueries pins stay deterministic across test ordering
+TOKEN_CACHE_TTL = 0
+
+# Same reasoning for the chat list's cached per-user chat count
+CHAT_COUNT_CACHE_TTL = 0
+
 
 # Disable migrations for tests (fresh database created for each test session)
 class DisableMigrations: